@@ -8,10 +8,13 @@ import dotenv
 import os
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.checkpoint.memory import MemorySaver
-from langgraph.prebuilt import create_react_agent
-import tools.basic_tools as bt
-import tools.combat_tools as ct
-from tools.game_state import game_state
+from datetime import datetime
+from langchain_core.messages import HumanMessage, SystemMessage, trim_messages
+from langchain_core.messages.utils import count_tokens_approximately
+from langgraph.prebuilt import create_react_agent, ToolNode
+from tools.game_state import game_state, PHASES
+from tools.phases import get_phase_tools, all_tools
+from tools.memory import remember_turn, remember_game_state, start_campaign
 
 # Load environment variables from .env file
 dotenv.load_dotenv(override=True)
@@ -20,15 +23,53 @@ dotenv.load_dotenv(override=True)
 gemini_api_key = os.getenv("GEMINI_API_KEY")
 llm = ChatGoogleGenerativeAI(api_key=gemini_api_key, model="gemini-2.5-flash")
 
-tools = [bt.calculator, bt.create_character, bt.read_objectives, bt.read_players, bt.set_character_property,bt.roll_dice, ct.initiative]
+# Approximate token budget for earlier turns sent to the model; older facts are fetched with the recall tool.
+HISTORY_TOKENS = 4000
 
-# Initialize the agent
+def keep_recent_messages(state) -> dict:
+    """
+    Pre-model hook that sends the system prompt, the earlier turns that fit in HISTORY_TOKENS,
+    and everything from the latest player message onward to the model. The current game phase
+    is added to the system prompt. The full history stays in the checkpointer.
+    """
+    history = state["messages"]
+    system = [m for m in history[:1] if isinstance(m, SystemMessage)]
+    prompt = system[0].content if system else ""
+    phase_prompt = SystemMessage(content=f"{prompt}\n\nCurrent phase: {game_state.current_phase}")
+    # the current turn (player message plus any tool calls so far) is always kept whole
+    current_start = max(
+        (i for i, m in enumerate(history) if isinstance(m, HumanMessage)),
+        default=len(system)
+    )
+    earlier = trim_messages(
+        history[len(system):current_start],
+        strategy="last",
+        token_counter=count_tokens_approximately,
+        max_tokens=HISTORY_TOKENS,
+        start_on="human"
+    )
+    return {"llm_input_messages": [phase_prompt] + earlier + history[current_start:]}
+
+# Bind each phase's tools once, so every model call only carries the schemas for the current phase.
+phase_models = {phase: llm.bind_tools(get_phase_tools(phase)) for phase in PHASES}
+
+def select_model(state, runtime):
+    """
+    Picks the model bound to the current phase's tools. Called before every model call,
+    so a set_phase call takes effect within the same turn.
+    """
+    return phase_models[game_state.current_phase]
+
+# Initialize the agent. The tool node can run every tool; the model only sees the current phase's.
 agent = create_react_agent(
-    model=llm,
-    tools=tools,
+    model=select_model,
+    tools=ToolNode(all_tools),
+    pre_model_hook=keep_recent_messages,
     checkpointer=MemorySaver()
 )
-config = {"configurable": {"thread_id": "asdfasdfasdf"}}
+# Each run is a new campaign: the checkpointer and game state start fresh, so campaign memory does too.
+config = {"configurable": {"thread_id": f"campaign_{datetime.now().strftime('%Y%m%d_%H%M%S')}"}}
+start_campaign(config["configurable"]["thread_id"])
 
 # system prompt
 messages = [{
@@ -43,6 +84,8 @@ messages = [{
     Create a Wizard NPC named "Eldrin" who is wise and knowledgeable about the forest. Eldrin can provide hints and guidance to the player, but he will not give away all the answers. The player must earn his trust to gain valuable information.
 
     Start by reading the objectives and players. They will start at level 1.
+    Only the recent conversation is shown to you. Use the recall tool to look up older events, NPCs, and places before relying on your memory of them.
+    The game is always in one phase: "exploration", "interaction" (talking with NPCs), or "combat". Call set_phase whenever the phase changes, e.g. when a fight breaks out or ends. Create any enemies before switching to combat.
     """
 },
 # {    "role": "user", "content": "begin prompted adventure."}
@@ -54,8 +97,13 @@ def run_agent(msg: str) -> str:
     
     # Get agent's response with tool usage tracking
     final_response = None
+    # The checkpointer already holds earlier turns, so only send the new player message,
+    # plus the system prompt if this thread has no history yet.
+    new_messages = [HumanMessage(content=msg)]
+    if not agent.get_state(config).values.get("messages"):
+        new_messages.insert(0, SystemMessage(content=messages[0]["content"]))
     
-    for step in agent.stream({"messages": messages}, config, stream_mode="values"):
+    for step in agent.stream({"messages": new_messages}, config, stream_mode="values"):
         # Print tool usage information
         if "actions" in step:
             for action in step["actions"]:
@@ -77,6 +125,15 @@ def run_agent(msg: str) -> str:
     # Append agent's response to conversation history
     messages.append({"role": "assistant", "content": agent_msg})
     
+    # Index this turn and any new or changed NPCs and locations for later recall.
+    # A failure here shouldn't cost the player the DM's reply.
+    try:
+        remember_turn(game_state.turn, msg, agent_msg)
+        remember_game_state()
+    except Exception as e:
+        print(f"Error indexing turn {game_state.turn} for recall: {str(e)}")
+    game_state.turn += 1
+    
     return agent_msg
 
       
@@ -88,7 +145,6 @@ def export_conversation(filename: str = None) -> None:
                                 If None, generates a timestamp-based filename.
     """
     if filename is None:
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"conversation_{timestamp}.txt"
     
@@ -0,0 +1,90 @@
+import pytest
+
+from tools import memory
+from tools.character import Character
+from tools.game_state import game_state
+from tools.memory import MemoryIndex, tokenize
+
+
+def test_keyed_record_is_replaced():
+    index = MemoryIndex()
+    index.add("NPC Eldrin: mood 3, guarding the bridge", key="npc:Eldrin")
+    index.add("NPC Eldrin: mood 7, resting at the inn", key="npc:Eldrin")
+    assert len(index) == 1
+    assert index.get("npc:Eldrin") == "NPC Eldrin: mood 7, resting at the inn"
+    assert index.search("bridge") == []
+    assert index.search("inn") == ["NPC Eldrin: mood 7, resting at the inn"]
+
+
+def test_reload_replays_log(tmp_path):
+    path = str(tmp_path / "campaign.jsonl")
+    index = MemoryIndex(path)
+    index.add("The player bought rope in the village")
+    index.add("Location visited: dark forest.", key="location:dark forest")
+    index.add("Location visited: dark forest (current location).", key="location:dark forest")
+
+    reloaded = MemoryIndex(path)
+    assert len(reloaded) == 2
+    assert reloaded.get("location:dark forest") == "Location visited: dark forest (current location)."
+    assert reloaded.search("rope") == ["The player bought rope in the village"]
+
+
+def test_empty_and_stopword_queries():
+    index = MemoryIndex()
+    assert index.search("cave") == []
+    index.add("Eldrin warned about the cave troll")
+    assert index.search("") == []
+    assert index.search("the of and") == []
+
+
+def test_best_match_first():
+    index = MemoryIndex()
+    index.add("The player bought rope in the village")
+    index.add("A troll guards the cave; the troll is hungry")
+    index.add("Eldrin mentioned a cave in passing")
+    assert index.search("troll cave", k=2) == [
+        "A troll guards the cave; the troll is hungry",
+        "Eldrin mentioned a cave in passing",
+    ]
+
+
+def test_possessives_match_base_word():
+    assert tokenize("Eldrin's staff") == tokenize("Eldrin’s staff") == ["eldrin", "staff"]
+    index = MemoryIndex()
+    index.add("Eldrin's staff glows in the dark")
+    index.add("Eldrin warned about the cave")
+    assert len(index.search("Eldrin")) == 2
+    assert index.search("Eldrin's warning about the cave")[0] == "Eldrin warned about the cave"
+
+
+def test_turn_labels_are_not_indexed():
+    index = MemoryIndex()
+    for turn in range(1, 20):
+        index.add(f"[Turn {turn}]\nPlayer: I look around\nDM: Nothing happens")
+    index.add("[Turn 20]\nPlayer: I draw my sword\nDM: The goblin flees")
+    assert "player" not in index.postings and "turn" not in index.postings
+    assert index.search("what did the player do on turn 20") == [
+        "[Turn 20]\nPlayer: I draw my sword\nDM: The goblin flees"
+    ]
+
+
+@pytest.fixture
+def grask(monkeypatch):
+    monkeypatch.setattr(memory, "campaign_memory", MemoryIndex())
+    npc = Character(False, "Grask", "Orc", "Barbarian", "Chaotic Evil",
+                    16, 12, 8, 15, 10, 8, hp=15, hit_dice=12, mood=-3)
+    game_state.npcs.append(npc)
+    yield npc
+    game_state.npcs.remove(npc)
+
+
+@pytest.mark.parametrize("conditions, expected", [
+    (["poisoned", "prone"], "Conditions: poisoned, prone."),
+    ("poisoned", "Conditions: poisoned."),
+    ([{"name": "poisoned", "rounds": 3}], "Conditions: {'name': 'poisoned', 'rounds': 3}."),
+    ([], "Conditions: None."),
+])
+def test_remember_game_state_handles_any_conditions(grask, conditions, expected):
+    grask.conditions = conditions
+    memory.remember_game_state()
+    assert expected in memory.campaign_memory.get("npc:Grask")
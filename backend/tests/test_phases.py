@@ -0,0 +1,56 @@
+import pytest
+
+from tools import basic_tools as bt
+from tools.game_state import game_state, PHASES
+from tools.phases import all_tools, get_phase_tools, phase_tools
+
+
+@pytest.fixture
+def restore_phase():
+    phase = game_state.current_phase
+    yield
+    game_state.current_phase = phase
+
+
+def test_set_phase_normalizes_and_sets(restore_phase):
+    assert bt.set_phase(" Combat ") == "combat"
+    assert game_state.current_phase == "combat"
+
+
+def test_set_phase_rejects_unknown_phase(restore_phase):
+    game_state.current_phase = "exploration"
+    with pytest.raises(ValueError):
+        bt.set_phase("shopping")
+    assert game_state.current_phase == "exploration"
+
+
+def test_get_phase_tools_rejects_unknown_phase():
+    with pytest.raises(ValueError):
+        get_phase_tools("shopping")
+
+
+def test_all_tools_covers_every_phase():
+    for phase in PHASES:
+        for tool in get_phase_tools(phase):
+            assert tool in all_tools
+
+
+def test_phases_bind_different_tools():
+    tool_sets = [frozenset(map(id, tools)) for tools in phase_tools.values()]
+    assert len(set(tool_sets)) == len(tool_sets)
+
+
+def test_create_character_compact_rejects_unknown_skill():
+    with pytest.raises(ValueError):
+        bt.create_character_compact(False, "Grask", "Orc", "Barbarian", "Chaotic Evil",
+                                    16, 12, 8, 15, 10, 8, hp=15, hit_dice=12, mood=-3,
+                                    proficiencies={"swordplay": 2})
+
+
+def test_create_character_compact_applies_proficiencies():
+    npc = bt.create_character_compact(False, "Grask", "Orc", "Barbarian", "Chaotic Evil",
+                                      16, 12, 8, 15, 10, 8, hp=15, hit_dice=12, mood=-3,
+                                      proficiencies={"athletics": 2})
+    game_state.npcs.remove(npc)
+    assert npc.get_skill_modifier("athletics") == 3 + 2
+    assert not npc.is_proficient("stealth")
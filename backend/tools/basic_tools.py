@@ -7,7 +7,7 @@ desc: holds basic gameplay tools for TTRP                    # Combat and specia
 """
 import random
 from .character import Character
-from .game_state import game_state
+from .game_state import game_state, PHASES
 
 def attack():
     game_state["player"]["hp"] -= 5
@@ -192,9 +192,33 @@ def create_character(is_player: bool, name: str, race: str, class_type: str, ali
         game_state.players.append(character)
     else:
         game_state.add_npc(character)
-    
+
     return character
 
+SKILLS = ("acrobatics", "animal_handling", "arcana", "athletics", "deception", "history",
+          "insight", "intimidation", "investigation", "medicine", "nature", "perception",
+          "performance", "persuasion", "religion", "sleight_of_hand", "stealth", "survival")
+
+def create_character_compact(is_player: bool, name: str, race: str, class_type: str, alignment: str,
+                             strength: int, dexterity: int, intelligence: int,
+                             constitution: int, wisdom: int, charisma: int,
+                             hp: int, hit_dice: int, mood: int, speed: int = 30,
+                             proficiencies: dict[str, int] = {},
+                             attacks: list[dict] = [], spells: list[dict] = [],
+                             resistances: list[str] = [], vulnerabilities: list[str] = []) -> Character:
+    """
+    Same as create_character, but takes the skill proficiencies as one dict
+    (e.g. {"stealth": 2, "survival": 2}) so the tool schema stays small.
+    """
+    unknown = set(proficiencies) - set(SKILLS)
+    if unknown:
+        raise ValueError(f"Unknown skills: {', '.join(sorted(unknown))}. Must be among {', '.join(SKILLS)}.")
+    return create_character(is_player, name, race, class_type, alignment,
+                            strength, dexterity, intelligence, constitution, wisdom, charisma,
+                            speed, hp, hit_dice, mood, **proficiencies,
+                            attacks=list(attacks), spells=list(spells),
+                            resistances=list(resistances), vulnerabilities=list(vulnerabilities))
+
 def set_character_property(chacter_name: str, property: str, value) -> None:
     """
     Sets a property of a character (player or NPC) to a new value.
@@ -223,4 +247,14 @@ def roll_stats(stat: str) -> dict[str, int]:
     Rolls 4d6 for each stat and returns the highest 3 rolls. The player can use this to generate their stats.
     """
     dice_rolls = sorted(roll_dice(4, 6), reverse=True)
-    return {stat: sum(dice_rolls[:3])}
\ No newline at end of file
+    return {stat: sum(dice_rolls[:3])}
+
+def set_phase(phase: str) -> str:
+    """
+    Sets the game phase ("combat", "exploration", or "interaction"), which changes your tools.
+    """
+    phase = phase.lower().strip()
+    if phase not in PHASES:
+        raise ValueError(f"Unknown phase: {phase}. Must be one of {', '.join(PHASES)}.")
+    game_state.current_phase = phase
+    return game_state.current_phase
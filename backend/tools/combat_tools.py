@@ -21,3 +21,4 @@ def initiative(character_name: str) -> int:
     for player in game_state.players:
         if player.name == character_name:
             return roll_dice(1, 20)[0] + player.stat_modifiers["dexterity"]
+    raise ValueError(f"Character {character_name} not found.")
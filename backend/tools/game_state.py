@@ -43,6 +43,8 @@ ex_char = Character(
 )
 
 # game_state.py
+PHASES = ("combat", "exploration", "interaction")
+
 class GameState:
     def __init__(self):
         self.npcs = []
@@ -0,0 +1,265 @@
+"""
+auth: AJ Boyd
+date: 10/19/2026
+desc: long-term campaign memory for TTRPG agent. Past turns, NPCs and locations are kept in
+      an on-disk BM25 index so the DM can recall old facts without resending the whole transcript.
+"""
+import json
+import math
+import os
+import re
+from collections import Counter
+from .game_state import game_state
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+POSSESSIVE_RE = re.compile(r"['’]s\b")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "has", "have",
+    "he", "her", "his", "i", "in", "is", "it", "its", "me", "my", "of", "on", "or", "she",
+    "that", "the", "their", "them", "they", "this", "to", "was", "we", "were", "what",
+    "with", "you", "your", "s", "t",
+    # labels on every turn record, which would otherwise match every turn
+    "turn", "player", "dm",
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits text into lowercase search terms, dropping possessive 's and common stopwords.
+    """
+    text = POSSESSIVE_RE.sub("", text.lower())
+    return [t for t in TOKEN_RE.findall(text) if t not in STOPWORDS]
+
+
+class MemoryIndex:
+    """
+    An incremental BM25 index over short text records, persisted as an append-only JSONL log.
+    Records added with a key (e.g. "npc:Eldrin") replace the previous record with that key.
+    """
+    def __init__(self, path: str = None, k1: float = 1.5, b: float = 0.75):
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self.docs = {}        # doc id -> text
+        self.doc_terms = {}   # doc id -> Counter of terms
+        self.doc_lens = {}    # doc id -> number of terms
+        self.postings = {}    # term -> {doc id: term frequency}
+        self.keys = {}        # key -> doc id
+        self.total_len = 0
+        self.next_id = 0
+        if path is not None and os.path.exists(path):
+            self._load()
+
+    def __len__(self):
+        return len(self.docs)
+
+    def _load(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._index(record["text"], record.get("key"))
+
+    def _index(self, text: str, key: str = None) -> int:
+        if key is not None and key in self.keys:
+            self._remove(self.keys[key])
+        doc_id = self.next_id
+        self.next_id += 1
+        terms = Counter(tokenize(text))
+        self.docs[doc_id] = text
+        self.doc_terms[doc_id] = terms
+        self.doc_lens[doc_id] = sum(terms.values())
+        self.total_len += self.doc_lens[doc_id]
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        if key is not None:
+            self.keys[key] = doc_id
+        return doc_id
+
+    def _remove(self, doc_id: int):
+        terms = self.doc_terms.pop(doc_id)
+        del self.docs[doc_id]
+        self.total_len -= self.doc_lens.pop(doc_id)
+        for term in terms:
+            posting = self.postings[term]
+            del posting[doc_id]
+            if not posting:
+                del self.postings[term]
+
+    def get(self, key: str) -> str | None:
+        """
+        Returns the text stored under the given key, or None if there is none.
+        """
+        doc_id = self.keys.get(key)
+        return self.docs[doc_id] if doc_id is not None else None
+
+    def add(self, text: str, key: str = None) -> None:
+        """
+        Adds a record to the index and appends it to the on-disk log.
+        Args:
+            text (str): The text to index
+            key (str, optional): A unique key; a record with the same key is replaced
+        """
+        self._index(text, key)
+        if self.path is not None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "text": text}) + "\n")
+
+    def search(self, query: str, k: int = 5) -> list[str]:
+        """
+        Returns the texts of the k records that best match the query, best first.
+        Args:
+            query (str): The search query
+            k (int): The maximum number of records to return
+        Returns:
+            list[str]: The matching record texts
+        """
+        n = len(self.docs)
+        if n == 0:
+            return []
+        avg_len = self.total_len / n or 1
+        scores = {}
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, tf in posting.items():
+                norm = tf + self.k1 * (1 - self.b + self.b * self.doc_lens[doc_id] / avg_len)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / norm
+        best = sorted(scores, key=scores.get, reverse=True)[:k]
+        return [self.docs[doc_id] for doc_id in best]
+
+
+MEMORY_DIR = os.path.join(os.getcwd(), "memory")
+
+# in-memory until start_campaign points it at a campaign's log
+campaign_memory = MemoryIndex()
+
+
+def start_campaign(campaign_id: str) -> None:
+    """
+    Points campaign memory at the log for the given campaign, loading it if it already exists.
+    Args:
+        campaign_id (str): The campaign's id, e.g. the agent's thread_id
+    """
+    global campaign_memory
+    campaign_memory = MemoryIndex(os.path.join(MEMORY_DIR, f"{campaign_id}.jsonl"))
+
+
+def remember_turn(turn: int, player_msg: str, dm_msg: str) -> None:
+    """
+    Indexes one exchange between the player and the DM.
+    """
+    campaign_memory.add(f"[Turn {turn}]\nPlayer: {player_msg}\nDM: {dm_msg}")
+
+
+def _join(values) -> str:
+    # character properties can be set to anything by the model, so don't assume a list of strings
+    if not values:
+        return "None"
+    if isinstance(values, (list, tuple, set)):
+        return ", ".join(str(v) for v in values)
+    return str(values)
+
+
+def remember_game_state() -> None:
+    """
+    Indexes the current NPC records and visited locations, skipping any that are unchanged.
+    """
+    records = {}
+    for npc in game_state.npcs:
+        records[f"npc:{npc.name}"] = (
+            f"NPC {npc.name}: {npc.race} {npc.class_type}, {npc.alignment}. "
+            f"HP {npc.hp}/{npc.max_hp}, mood {npc.mood}. "
+            f"Attacks: {_join(npc.attacks)}. "
+            f"Spells: {_join(npc.spells)}. "
+            f"Conditions: {_join(npc.conditions)}."
+        )
+    for location in game_state.locations:
+        current = " (current location)" if location == game_state.current_location else ""
+        records[f"location:{location}"] = f"Location visited: {location}{current}."
+    for key, text in records.items():
+        if campaign_memory.get(key) != text:
+            campaign_memory.add(text, key=key)
+
+
+def recall(query: str, k: int = 5) -> list[str]:
+    """
+    Searches the campaign history (past turns, NPCs, and visited locations) for facts
+    relevant to the query. Use this to remember events that are no longer in the recent conversation.
+    Args:
+        query (str): What to look for, e.g. "Eldrin's warning about the cave"
+        k (int): The maximum number of results to return (default 5).
+    Returns:
+        list[str]: The most relevant past records, best match first.
+    """
+    return campaign_memory.search(query, k)
+
+
+if __name__ == "__main__":
+    # benchmark on a synthetic 10k-turn campaign; run from backend/ with: python -m tools.memory
+    import random
+    import tempfile
+    import time
+
+    random.seed(0)
+    vocab = [f"word{i}" for i in range(5000)]
+    names = ["Eldrin", "Mira", "Thorne", "Grask", "Velka", "Oswin"]
+    game_words = ["cave", "forest", "sword", "goblin", "trail", "attack", "treasure", "trap",
+                  "wizard", "village", "the", "player", "rolls", "warning"]
+
+    def fake_turn():
+        words = (random.choices(vocab, k=random.randint(20, 80)) + random.choices(game_words, k=3)
+                 + [random.choice(names) + "'s"])
+        random.shuffle(words)
+        return " ".join(words)
+
+    def natural_query():
+        name = random.choice(names)
+        return random.choice([
+            f"what did the player do on turn {random.randint(1, 10_000)}",
+            f"where did the player meet {name}",
+            f"{name}'s warning about the cave",
+            f"the goblin attack on the trail",
+        ])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "campaign_index.jsonl")
+        index = MemoryIndex(path)
+        add_times = []
+        for turn in range(10_000):
+            start = time.perf_counter()
+            index.add(f"[Turn {turn}]\nPlayer: {fake_turn()}\nDM: {fake_turn()}")
+            add_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        reloaded = MemoryIndex(path)
+        load_time = time.perf_counter() - start
+
+        query_times = []
+        natural_query_times = []
+        for _ in range(200):
+            query = " ".join(random.choices(vocab, k=4) + [random.choice(names)])
+            start = time.perf_counter()
+            reloaded.search(query, 5)
+            query_times.append(time.perf_counter() - start)
+
+            query = natural_query()
+            start = time.perf_counter()
+            reloaded.search(query, 5)
+            natural_query_times.append(time.perf_counter() - start)
+
+    def summary(times):
+        times = sorted(times)
+        mean = 1000 * sum(times) / len(times)
+        p95 = 1000 * times[int(0.95 * len(times))]
+        return f"mean {mean:.3f} ms, p95 {p95:.3f} ms"
+
+    print("Campaign memory benchmark (10k turns)")
+    print("=====================================")
+    print(f"index update: {summary(add_times)}")
+    print(f"load from disk: {1000 * load_time:.0f} ms")
+    print(f"query (k=5, rare words): {summary(query_times)}")
+    print(f"query (k=5, natural): {summary(natural_query_times)}")
@@ -0,0 +1,85 @@
+"""
+auth: AJ Boyd
+date: 10/19/2026
+desc: maps each game phase to the tools the agent binds for it, so every model call
+      only carries the tool schemas it can actually use.
+"""
+import json
+from langchain_core.tools import StructuredTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from . import basic_tools as bt
+from . import combat_tools as ct
+from . import memory
+from .game_state import PHASES
+
+# create_character has dozens of parameters and a very long docstring. Bind the compact
+# version instead: one proficiencies dict in place of the 18 skill arguments, and a short description.
+compact_create_character = StructuredTool.from_function(
+    func=bt.create_character_compact,
+    name="create_character",
+    description=(
+        "Creates a player or NPC. proficiencies maps skill names to bonuses, e.g. {'stealth': 2}. "
+        "attacks and spells are lists of dicts, e.g. {'name': 'Longsword', 'damage': '1d8', 'type': 'slashing'}."
+    ),
+)
+
+# tools bound in every phase
+common_tools = [bt.roll_dice, bt.read_players, bt.set_character_property, bt.set_phase, memory.recall]
+
+phase_tools = {
+    # enemies are created before the fight starts, so combat carries only what a fight needs
+    "combat": common_tools + [bt.calculator, ct.initiative],
+    "exploration": common_tools + [bt.calculator, bt.read_objectives, compact_create_character],
+    # talking with NPCs: skill checks, reading and changing characters (e.g. mood)
+    "interaction": common_tools,
+}
+assert set(phase_tools) == set(PHASES), "every game phase needs a tool list"
+
+# every tool that can be bound in some phase; the agent's tool node runs any of them
+all_tools = common_tools + [bt.calculator, ct.initiative, bt.read_objectives, compact_create_character]
+
+# the seven tools bound on every call before phase-aware binding (used for comparison in schema_report)
+baseline_tools = [bt.calculator, bt.create_character, bt.read_objectives, bt.read_players,
+                  bt.set_character_property, bt.roll_dice, ct.initiative]
+
+
+def get_phase_tools(phase: str) -> list:
+    """
+    Returns the tools to bind for the given game phase.
+    Args:
+        phase (str): One of "combat", "exploration", or "interaction".
+    Returns:
+        list: The tools available in that phase.
+    """
+    if phase not in phase_tools:
+        raise ValueError(f"Unknown phase: {phase}. Must be one of {', '.join(PHASES)}.")
+    return phase_tools[phase]
+
+
+def schema_bytes(tools: list) -> int:
+    """
+    Returns the size in bytes of the JSON tool schemas sent to the model for the given tools.
+    """
+    return sum(len(json.dumps(convert_to_openai_tool(t)).encode("utf-8")) for t in tools)
+
+
+def schema_report() -> dict[str, int]:
+    """
+    Returns the schema bytes bound per phase, plus "baseline" for the original seven tools
+    bound with their full docstrings.
+    """
+    report = {"baseline": schema_bytes(baseline_tools)}
+    for phase in PHASES:
+        report[phase] = schema_bytes(phase_tools[phase])
+    return report
+
+
+if __name__ == "__main__":
+    # run from backend/ with: python -m tools.phases
+    report = schema_report()
+    baseline = report["baseline"]
+    print("Tool schema bytes per phase")
+    print("===========================")
+    for phase, size in report.items():
+        saved = 100 * (baseline - size) / baseline
+        print(f"{phase:<12} {size:>7} bytes  ({saved:.0f}% smaller than baseline)")